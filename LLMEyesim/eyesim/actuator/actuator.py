@@ -1,10 +1,15 @@
+import struct
 from typing import List, Optional, Tuple
 
-from eye import *
+from eye import CAMGet, CAMInit, LCDImage, LIDARGet, QVGA, SIMGetRobot, VWStraight, VWTurn, VWWait
 from loguru import logger
 import numpy as np
 
 from LLMEyesim.eyesim.actuator.models import Action, Position
+from LLMEyesim.eyesim.utils.target_detection import clear_hue_cache
+
+# SIMGetRobot returns x, y, z and phi as four little-endian 32-bit ints
+_POS_STRUCT = struct.Struct('<4i')
 
 
 class RobotActuator:
@@ -20,6 +25,8 @@ class RobotActuator:
 
         self.img = None
         self.scan = None
+        # LIDAR readings are copied into this buffer so every consumer sees one int32 array
+        self._scan_buf = np.empty(360, dtype=np.int32)
         self.step: int = 0
         self.last_command: List[Action] = [Action("stop")]
 
@@ -33,17 +40,30 @@ class RobotActuator:
         self.update_position()
         logger.success(f"Successfully initialized hardware {self.robot_name}-{self.robot_id}")
 
-    def update_sensors(self) -> Tuple[List[int], np.ndarray]:
-        """Update sensors in parallel using threads"""
+    def update_sensors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Read the camera and LIDAR, show the frame on the LCD and return (scan, img).
+
+        The scan is a reused int32 buffer that the next call overwrites, copy it to keep it.
+        """
         self.img = CAMGet()
+        clear_hue_cache()
         LCDImage(self.img)
-        self.scan = LIDARGet()
+        scan = LIDARGet()
+        if len(scan) != len(self._scan_buf):
+            self._scan_buf = np.empty(len(scan), dtype=np.int32)
+        self._scan_buf[:] = scan
+        self.scan = self._scan_buf
         return self.scan, self.img
 
     def update_position(self) -> Position:
         """Update robot position state by creating new Position instance"""
-        pos = [int.from_bytes(x, byteorder='little') for x in SIMGetRobot(self.robot_id)]
-        self.position = Position(x=pos[0], y=pos[1], phi=pos[3])
+        raw = SIMGetRobot(self.robot_id)
+        # Per-field byte strings are joined, unpack raises if the result is not exactly 16 bytes
+        if isinstance(raw, (list, tuple)):
+            raw = b''.join(raw)
+        x, y, _, phi = _POS_STRUCT.unpack(raw)
+        self.position = Position(x=x, y=y, phi=phi)
         return self.position
 
     def format_last_command(self) -> Optional[List[str]]:
@@ -7,4 +7,19 @@ GRID_DIRECTION = {
     'southeast': 315,
     'southwest': 225,
     'northwest': 135
-}
\ No newline at end of file
+}
+
+# Unit step per grid direction, diagonals use cos(45°) truncated to 0.707
+GRID_STEP = {
+    'north': (0.0, 1.0),
+    'east': (1.0, 0.0),
+    'south': (0.0, -1.0),
+    'west': (-1.0, 0.0),
+    'northeast': (0.707, 0.707),
+    'southeast': (0.707, -0.707),
+    'southwest': (-0.707, -0.707),
+    'northwest': (-0.707, 0.707)
+}
+
+# Signed shortest turn in degrees, indexed by (target - heading) % 360
+SHORTEST_TURN = tuple(diff if diff <= 180 else diff - 360 for diff in range(360))
@@ -1,33 +1,15 @@
 from dataclasses import dataclass, field
-from functools import lru_cache
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional
 
+import numpy as np
 
-@dataclass(frozen=True)
-class Position:
-    """Immutable robot position data with type hints"""
+
+class Position(NamedTuple):
+    """Immutable robot position, a tuple so hashing, equality and unpacking run in C"""
     x: int
     y: int
     phi: int
 
-    def __hash__(self):
-        """Custom hash implementation for floating point values"""
-        return hash((self.x, self.y, self.phi))
-
-    def __eq__(self, other):
-        """Custom equality check for floating point values"""
-        if not isinstance(other, Position):
-            return False
-        return (self.x == other.x and
-                self.y == other.y and
-                self.phi == other.phi)
-
-    def __iter__(self):
-        """Make position iterable for unpacking"""
-        yield self.x
-        yield self.y
-        yield self.phi
-
     def __str__(self) -> str:
         """String representation of position"""
         return f"x={self.x}, y={self.y}, phi={self.phi}"
@@ -40,20 +22,23 @@ class Position:
         """Generate a natural language description of the position"""
         return f"position ({self.x}, {self.y}) facing {self.phi}°"
 
-@dataclass
+@dataclass(slots=True, unsafe_hash=True)
 class Action:
     """
     Represents a robotic action with position tracking and safety checks.
-    Uses slots for memory optimization and frozen=True for immutability where possible.
+    Equality and hashing only cover action, direction, distance and angle, so the
+    execution state can change freely. Do not mutate those four fields while the
+    action is used as a dict key or set member.
     """
     action: str
     direction: str = ""
     distance: int = 0
     angle: int = 0
-    safe: bool = True
-    executed: bool = False
-    pos_before: Dict[str, float] = field(default_factory=dict)
-    pos_after: Dict[str, float] = field(default_factory=dict)
+    # Execution state is left out of equality and hashing, which only cover the command itself
+    safe: bool = field(default=True, compare=False)
+    executed: bool = field(default=False, compare=False)
+    pos_before: Dict[str, float] = field(default_factory=dict, compare=False)
+    pos_after: Dict[str, float] = field(default_factory=dict, compare=False)
 
     def __str__(self) -> str:
         """Memory-efficient string representation"""
@@ -62,18 +47,6 @@ class Action:
             f"dist={self.distance}, angle={self.angle}, safe={self.safe})"
         )
 
-    def __hash__(self):
-        # Only hash the immutable attributes
-        return hash((self.action, self.direction, self.distance, self.angle))
-
-    def __eq__(self, other):
-        if not isinstance(other, Action):
-            return False
-        return (self.action == other.action and
-                self.direction == other.direction and
-                self.distance == self.distance and
-                self.angle == self.angle)
-
     def to_dict(self, step: Optional[int] = None, target_lost: bool = False) -> Dict:
         """
         Convert action to dictionary with optional step and target_lost parameters
@@ -105,26 +78,20 @@ class Action:
             if attr in valid_attrs:
                 setattr(self, attr, value)
 
-    @lru_cache(maxsize=256)
-    def _calculate_safety(self, distance: int, required_clearance: int = 100) -> bool:
-        """Optimized safety calculation with increased cache size"""
-        return distance >= abs(self.distance) + required_clearance
-
-    def is_safe(self, scan: List[int], range_degrees: int = 30) -> bool:
+    def is_safe(self, scan: List[int], range_degrees: int = 30, required_clearance: int = 100) -> bool:
         """
         Enhanced safety check for C integer array input
         """
-        if not scan:  # Early validation
+        if scan is None or len(scan) == 0:  # Early validation
             self.safe = False
             return False
 
         offset = 179 if self.direction != "backward" else 0
 
-        # Direct array indexing instead of dictionary get()
-        scan_values = [scan[offset + direction]
-                       for direction in range(-range_degrees, range_degrees + 1)]
+        # Zero-copy view of the scan, only a window crossing index 0 (behind the robot) needs a gather
+        scan_arr = np.asarray(scan)
+        lo, hi = offset - range_degrees, offset + range_degrees + 1
+        window = scan_arr[lo:hi] if lo >= 0 else np.take(scan_arr, np.arange(lo, hi))
 
-        self.safe = all(self._calculate_safety(distance) for distance in scan_values)
+        self.safe = bool((window >= abs(self.distance) + required_clearance).all())
         return self.safe
-
-
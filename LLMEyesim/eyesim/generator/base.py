@@ -1,5 +1,4 @@
 import os
-from pathlib import Path
 from typing import List, Literal
 
 from loguru import logger
@@ -15,6 +14,22 @@ from LLMEyesim.eyesim.generator.legacy.config import (
 from LLMEyesim.eyesim.generator.models import WorldItem
 from LLMEyesim.utils.constants import EYESIM_DIR, SCRIPT_DIR, WORLD_DIR
 
+_ROBOT_SCRIPT_TEMPLATE = """#!/Users/wenxiao/miniconda3/envs/llmeyesim/bin/python
+
+from LLMEyesim.eyesim.actuator.actuator import RobotActuator
+from LLMEyesim.eyesim.generator.models import WorldItem
+from LLMEyesim.llm.agents.agent import ExecutiveAgent
+from LLMEyesim.integration.agent import EmbodiedAgent
+
+if __name__ == '__main__':
+    
+    world_items = {world_items}
+    agent = ExecutiveAgent(llm_name='{llm_name}', llm_type="cloud")
+    actuator = RobotActuator(robot_id={robot_id}, robot_name='{robot_name}')
+    embodied_agent = EmbodiedAgent(agent, actuator, world_items)
+    embodied_agent.run_agent()
+"""
+
 
 class WorldGenerator:
     def __init__(self, world_name: str, llm_name: str = "gpt-4o-mini"):
@@ -27,9 +42,9 @@ class WorldGenerator:
 
         self.items: List[WorldItem] = []
         self.robots: List[WorldItem] = []
-        self.robot_settings: str = ""
+        self._robot_lines: List[str] = []
         self.objects: List[WorldItem] = []
-        self.object_settings: str = ""
+        self._object_lines: List[str] = []
         self.world_name = world_name
         self._init_execute_permission()
 
@@ -39,21 +54,39 @@ class WorldGenerator:
         self.dynamic_obstacles = RANDOM_LABBOT_LOCATIONS
         self.static_obstacles = RANDOM_SOCCER_LOCATIONS
 
+    @property
+    def robot_settings(self) -> str:
+        return "".join(self._robot_lines)
+
+    @property
+    def object_settings(self) -> str:
+        return "".join(self._object_lines)
+
     @staticmethod
     def _init_execute_permission():
         """Make all files in the script and world directories executable with 0o777 permissions."""
-        dirs = [Path(SCRIPT_DIR), Path(WORLD_DIR)]
-
-        for dir_path in dirs:
+        for dir_path in (SCRIPT_DIR, WORLD_DIR):
             try:
-                for file in dir_path.iterdir():
-                    if file.is_file():
-                        file.chmod(0o777)
-                        print(f"Made {file.name} executable")
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        # DirEntry carries the file type, and files from earlier runs are already executable
+                        if not entry.is_file(follow_symlinks=False) or entry.stat().st_mode & 0o777 == 0o777:
+                            continue
+                        os.chmod(entry.path, 0o777)
+                        logger.debug(f"Made {entry.name} executable")
             except PermissionError:
-                print(f"Permission denied for files in {dir_path}")
+                logger.warning(f"Permission denied for files in {dir_path}")
             except Exception as e:
-                print(f"Error processing {dir_path}: {e}")
+                logger.error(f"Error processing {dir_path}: {e}")
+
+    @staticmethod
+    def _write_executable(path: str, content: str) -> None:
+        """Write content to path with 0o777 permissions set through the open file descriptor."""
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o777)
+        with os.fdopen(fd, "w") as f:
+            # The open() mode is masked by the umask and ignored for existing files
+            os.fchmod(fd, 0o777)
+            f.write(content)
 
     def init_sim(self, **kwargs):
         raise NotImplementedError
@@ -63,7 +96,9 @@ class WorldGenerator:
             raise ValueError(f"Robot {robot_name} is not in the list of available robots")
         item_id = len(self.robots) + 1
         self.robots.append(WorldItem(item_id=item_id, item_name=robot_name, item_type='robot', x=x, y=y, angle=angle))
-        self.robot_settings += f"{robot_name} {x} {y} {angle} {SCRIPT_DIR}/{self.llm_name}_{robot_name}_{item_id}.py\n"
+        self._robot_lines.append(
+            f"{robot_name} {x} {y} {angle} {SCRIPT_DIR}/{self.llm_name}_{robot_name}_{item_id}.py\n"
+        )
 
     def create_object(self, object_name: str, object_type: Literal['target', 'obstacle', 'robot'], x: int, y: int,
                       angle: int) -> None:
@@ -71,39 +106,28 @@ class WorldGenerator:
             raise ValueError(f"Object {object_name} is not in the list of available objects")
         item_id = len(self.robots) + len(self.objects) + 1
         self.objects.append(WorldItem(item_id=item_id, item_name=object_name, item_type=object_type, x=x, y=y, angle=angle))
-        self.object_settings += f"{object_name} {x} {y} {angle}\n"
+        self._object_lines.append(f"{object_name} {x} {y} {angle}\n")
 
     def write_robot_script(self) -> None:
         self.items = self.robots + self.objects
-        logger.debug("Creating robot script content")
+        # Every robot script embeds the same item list, so render it once
+        world_items = repr(self.items)
         try:
             for i, robot in enumerate(self.robots):
-                content = f"""#!/Users/wenxiao/miniconda3/envs/llmeyesim/bin/python
-
-from LLMEyesim.eyesim.actuator.actuator import RobotActuator
-from LLMEyesim.eyesim.generator.models import WorldItem
-from LLMEyesim.llm.agents.agent import ExecutiveAgent
-from LLMEyesim.integration.agent import EmbodiedAgent
-
-if __name__ == '__main__':
-    
-    world_items = {self.items}
-    agent = ExecutiveAgent(llm_name='{self.llm_name}', llm_type="cloud")
-    actuator = RobotActuator(robot_id={i + 1}, robot_name='{robot.item_name}')
-    embodied_agent = EmbodiedAgent(agent, actuator, world_items)
-    embodied_agent.run_agent()
-"""
+                content = _ROBOT_SCRIPT_TEMPLATE.format(
+                    world_items=world_items,
+                    llm_name=self.llm_name,
+                    robot_id=i + 1,
+                    robot_name=robot.item_name
+                )
                 script_file = f"{SCRIPT_DIR}/{self.llm_name}_{robot.item_name}_{i + 1}.py"
-                with open(script_file, "w") as f:
-                    f.write(content)
-                os.chmod(script_file, 0o777)
+                self._write_executable(script_file, content)
                 logger.success(f"Successfully wrote and made executable script file to {script_file}")
         except Exception as e:
             logger.error(f"Failed to write script file: {str(e)}")
             raise
 
     def generate_sim_file(self):
-        logger.debug("Creating simulation file content")
         try:
             content = f"""
 # world 
@@ -120,9 +144,7 @@ object {self.obstacle_file}
 {self.object_settings}
             """
             sim_file = f"{EYESIM_DIR}/default.sim"
-            with open(sim_file, "w") as f:
-                f.write(content)
-            os.chmod(sim_file, 0o777)
+            self._write_executable(sim_file, content)
             logger.success(f"Successfully wrote and made executable simulation file to {sim_file}")
         except Exception as e:
             logger.error(f"Failed to write simulation file: {str(e)}")
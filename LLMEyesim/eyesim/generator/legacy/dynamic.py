@@ -1,31 +1,40 @@
+from pathlib import Path
 import random
 
 from LLMEyesim.eyesim.generator.base import WorldGenerator
 from LLMEyesim.utils.constants import SCRIPT_DIR
 
-
-class DynamicWorld(WorldGenerator):
-    def __init__(self, world_name: str):
-        super().__init__(world_name=world_name)
-
-    def init_sim(self, **kwargs):
-        indices = random.sample(range(len(self.dynamic_obstacles)), 2)
-
-        content = f"""
+_SIM_TEMPLATE = """
 # world
-world {self.world_file}
+world {world_file}
 
 settings VIS TRACE
 
 # Robots
-{self.dynamic_obstacles[indices[0]]} {SCRIPT_DIR}/labbot.py
+{labbot_1} {script_dir}/labbot.py
 
-{self.dynamic_obstacles[indices[1]]} {SCRIPT_DIR}/labbot.py
+{labbot_2} {script_dir}/labbot.py
 
-{random.choices(self.llm_robot)[0]} {SCRIPT_DIR}/s4.py
+{llm_robot} {script_dir}/s4.py
 
 # Objects
-{random.choices(self.target)[0]}
+{target}
         """
-        with open(self.sim_file, "w") as f:
-            f.write(content)
+
+
+class DynamicWorld(WorldGenerator):
+    def __init__(self, world_name: str):
+        super().__init__(world_name=world_name)
+
+    def init_sim(self, **kwargs):
+        labbot_1, labbot_2 = random.sample(self.dynamic_obstacles, 2)
+
+        content = _SIM_TEMPLATE.format(
+            world_file=self.world_file,
+            labbot_1=labbot_1,
+            labbot_2=labbot_2,
+            llm_robot=random.choice(self.llm_robot),
+            target=random.choice(self.target),
+            script_dir=SCRIPT_DIR
+        )
+        Path(self.sim_file).write_text(content)
@@ -1,23 +1,29 @@
+from pathlib import Path
 import random
 
 from LLMEyesim.eyesim.generator.base import WorldGenerator
 
-
-class FreeWorld(WorldGenerator):
-    def __init__(self, world_name: str):
-        super().__init__(world_name=world_name)
-
-    def init_sim(self , **kwargs):
-        content = f"""
-world {self.world_file}
+_SIM_TEMPLATE = """
+world {world_file}
 
 settings VIS TRACE
 
 # Robots
-{random.choices(self.llm_robot)[0]}
+{llm_robot}
 
 # Objects
-{random.choices(self.target)[0]}
+{target}
         """
-        with open(self.sim_file, "w") as f:
-            f.write(content)
+
+
+class FreeWorld(WorldGenerator):
+    def __init__(self, world_name: str):
+        super().__init__(world_name=world_name)
+
+    def init_sim(self , **kwargs):
+        content = _SIM_TEMPLATE.format(
+            world_file=self.world_file,
+            llm_robot=random.choice(self.llm_robot),
+            target=random.choice(self.target)
+        )
+        Path(self.sim_file).write_text(content)
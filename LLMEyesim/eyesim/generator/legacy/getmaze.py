@@ -18,7 +18,7 @@ array = np.array([
     [1.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 0.0, 1.0, 0.0],
     [1.0, 1.0, 1.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 1.0],
     [0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0]
-])
+], dtype=np.uint8)
 
 def generate_blank_maze(array, scaling=360):
     """
@@ -32,25 +32,18 @@ def generate_blank_maze(array, scaling=360):
     - maze_lines (list of str): 迷宫的每一行字符串列表。
     """
     rows, cols = array.shape
-    maze_lines = []
 
     # 生成顶部边界，并确保长度一致
     top_boundary = " " + "_ " * cols 
-    maze_lines.append(top_boundary)
 
-    # 生成中间的行（仅左右边界，无内部墙壁）
-    for _ in range(rows-1):
-        line = "|" + " " * (cols * 2 - 1) + "|"
-        maze_lines.append(line)
+    # 生成中间的行（仅左右边界，无内部墙壁），所有中间行相同，只构造一次
+    middle = "|" + " " * (cols * 2 - 1) + "|"
 
     # 生成底部边界
     bottom_boundary = "|" + "_ " * (cols - 1) + "_" + "|"
-    maze_lines.append(bottom_boundary)
 
     # 添加缩放因子
-    maze_lines.append(str(scaling))
-
-    return maze_lines
+    return [top_boundary, *([middle] * (rows - 1)), bottom_boundary, str(scaling)]
 
 def save_maze_to_file(maze_lines, filename):
     """
@@ -62,8 +55,7 @@ def save_maze_to_file(maze_lines, filename):
     """
     try:
         with open(filename, 'w', encoding='utf-8') as file:
-            for line in maze_lines:
-                file.write(line + "\n")
+            file.write("\n".join(maze_lines) + "\n")
         print(f"迷宫已成功保存到 {filename}")
     except IOError as e:
         print(f"保存迷宫时出错: {e}")
@@ -81,18 +73,14 @@ def generate_obstacle_positions(array, x_scale=360, y_scale=360, x_offset=180, y
     - z (int): z轴的固定值。
 
     返回:
-    - positions (list of tuples): 障碍物的位置列表，每个位置为(x, y, z)。
+    - positions (np.ndarray): 障碍物的位置数组，形状为 (N, 3)，每行为(x, y, z)，按行优先顺序排列。
     """
-    positions = []
-    rows, cols = array.shape
-    for row in range(rows):
-        for col in range(cols):
-            if array[row, col] == 1:
-                x = x_scale * col + x_offset
-                # 竖直反转 y 坐标
-                y = y_scale * (rows - 1 - row) + y_offset
-                positions.append((x, y, z))
-    return positions
+    rows = array.shape[0]
+    row_idx, col_idx = np.nonzero(array)
+    x = x_scale * col_idx + x_offset
+    # 竖直反转 y 坐标
+    y = y_scale * (rows - 1 - row_idx) + y_offset
+    return np.stack([x, y, np.full_like(x, z)], axis=1)
 
 def generate_sim_file(maze_filename, obstacle_positions, filename):
     """
@@ -109,9 +97,7 @@ def generate_sim_file(maze_filename, obstacle_positions, filename):
             file.write(f'world "{maze_filename}"\n\n')
 
             # 写入障碍物部分
-            for pos in obstacle_positions:
-                line = f"Crate1 {pos[0]} {pos[1]} {pos[2]}"
-                file.write(line + "\n")
+            file.write("".join(f"Crate1 {x} {y} {z}\n" for x, y, z in obstacle_positions))
         print(f"Sim文件已成功保存到 {filename}")
     except IOError as e:
         print(f"保存Sim文件时出错: {e}")
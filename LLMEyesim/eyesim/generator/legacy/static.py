@@ -1,28 +1,33 @@
+from pathlib import Path
 import random
 
 from LLMEyesim.eyesim.generator.base import WorldGenerator
 
-
-class StaticWorld(WorldGenerator):
-    def __init__(self, world_name: str):
-        super().__init__(world_name=world_name)
-
-    def init_sim(self, **kwargs):
-        indices = random.sample(range(len(self.static_obstacles)), 4)
-        content = f"""
+_SIM_TEMPLATE = """
 # world
-world {self.world_file}
+world {world_file}
 
 settings VIS TRACE
 # Robots
-{random.choices(self.llm_robot)[0]}
+{llm_robot}
 
 # Objects
-{random.choices(self.target)[0]}
-{self.static_obstacles[indices[0]]}
-{self.static_obstacles[indices[1]]}
-{self.static_obstacles[indices[2]]}
-{self.static_obstacles[indices[3]]}
+{target}
+{obstacles}
         """
-        with open(self.sim_file, "w") as f:
-            f.write(content)
\ No newline at end of file
+
+
+class StaticWorld(WorldGenerator):
+    def __init__(self, world_name: str):
+        super().__init__(world_name=world_name)
+
+    def init_sim(self, **kwargs):
+        obstacles = random.sample(self.static_obstacles, 4)
+
+        content = _SIM_TEMPLATE.format(
+            world_file=self.world_file,
+            llm_robot=random.choice(self.llm_robot),
+            target=random.choice(self.target),
+            obstacles="\n".join(obstacles)
+        )
+        Path(self.sim_file).write_text(content)
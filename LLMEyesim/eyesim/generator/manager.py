@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from LLMEyesim.eyesim.generator.base import WorldGenerator
 from LLMEyesim.eyesim.generator.demo import DemoWorld
 from LLMEyesim.eyesim.generator.legacy.dynamic import DynamicWorld
@@ -7,24 +9,26 @@ from LLMEyesim.eyesim.generator.legacy.static import StaticWorld
 
 
 class WorldManager:
+    world_type = MappingProxyType({
+        "dynamic": DynamicWorld,
+        "free": FreeWorld,
+        "static": StaticWorld,
+        "mixed": MixedWorld,
+        "demo": DemoWorld
+    })
+
     def __init__(self, world_name: str, llm_name: str = "gpt-4o-mini"):
-        self.world_type = {
-            "dynamic": DynamicWorld,
-            "free": FreeWorld,
-            "static": StaticWorld,
-            "mixed": MixedWorld,
-            "demo": DemoWorld
-        }
         self.world = self._init_world(world_name, llm_name)
 
-    def _init_world(self, world_name: str, llm_name) -> WorldGenerator:
+    @classmethod
+    def _init_world(cls, world_name: str, llm_name) -> WorldGenerator:
         world_name = world_name.lower()
-        llm_name = llm_name.lower()
-        if world_name not in self.world_type:
+        world_class = cls.world_type.get(world_name)
+        if world_class is None:
             raise NotImplementedError(
-                f"Invalid world type. Must be one of: {', '.join(self.world_type.keys())}"
+                f"Invalid world type. Must be one of: {', '.join(cls.world_type.keys())}"
             )
-        return self.world_type[world_name](world_name, llm_name)
+        return world_class(world_name, llm_name.lower())
 
     def init_sim(self, **kwargs):
         return self.world.init_sim(**kwargs)
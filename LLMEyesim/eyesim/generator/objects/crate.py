@@ -1,4 +1,4 @@
-CRATE_LOCATIONS = [
+CRATE_LOCATIONS = (
     (2520, 3720),  # Top
     (1080, 3000),  # Upper left
     (3480, 3000),  # Upper right
@@ -8,4 +8,4 @@ CRATE_LOCATIONS = [
     (2760, 1320),  # Lower middle
     (600, 840),    # Bottom left
     (2280, 600)    # Bottom middle
-]
\ No newline at end of file
+)
\ No newline at end of file
@@ -1,6 +1,6 @@
-ROBOT_LOCATIONS = [
+ROBOT_LOCATIONS = (
     (200, 267),    # Bottom-left corner
     (3800, 200),   # Bottom-right corner
     (200, 3800),   # Top-left corner
     (3800, 3800)   # Top-right corner
-]
\ No newline at end of file
+)
\ No newline at end of file
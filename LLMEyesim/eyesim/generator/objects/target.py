@@ -1,6 +1,6 @@
-TARGET_LOCATIONS = [
+TARGET_LOCATIONS = (
     (2000, 3667),  # Top middle
     (333, 2000),   # Left middle
     (3667, 2000),  # Right middle
     (2000, 333)    # Bottom middle
-]
+)
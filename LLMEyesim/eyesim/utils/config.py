@@ -9,4 +9,47 @@ DIRECTION_RANGES = {
     'southeast': (292.5, 337.5),
     'southwest': (202.5, 247.5),
     'northwest': (112.5, 157.5)
-}
\ No newline at end of file
+}
+
+STATE_RECORD_FIELDS = (
+    "step",
+    "x",
+    "y",
+    "phi",
+    "img_path",
+    "img",
+    "lidar_path",
+    "lidar",
+    "last_command",
+)
+
+LLM_REASONING_RECORD_FIELDS = (
+    "step",
+    "task_name",
+    "model_name",
+    "perception",
+    "planning",
+    "control",
+    "attack_injected",
+    "completion_tokens",
+    "prompt_tokens",
+    "total_tokens",
+    "response_time",
+)
+
+LLM_ACTION_RECORD_FIELDS = (
+    "step",
+    "action",
+    "direction",
+    "distance",
+    "angle",
+    "safe",
+    "executed",
+    "pos_before",
+    "pos_after",
+    "target_lost",
+)
+
+CSV_FLUSH_THRESHOLD = 32
+CSV_BUFFER_SIZE = 1 << 16
+LLM_RECORD_BUFFER_SIZE = 1 << 20
@@ -1,7 +1,9 @@
 import base64
-from functools import lru_cache
+from collections import OrderedDict
+import hashlib
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+import threading
+from typing import Dict, List, Optional, Tuple, Union
 
 from PIL import Image
 from eye import QVGA_X, QVGA_Y
@@ -11,31 +13,88 @@ import seaborn as sns
 
 from LLMEyesim.eyesim.utils.models import PlotConfig
 
+# Style, context and dpi last applied to the global seaborn/matplotlib state
+_applied_plot_defaults: Optional[Tuple[str, str, int]] = None
+
 
 class ImageProcess:
     """Enhanced image processing class with optimizations and caching"""
 
+    # Number of rendered plots kept for reuse when the same scan is plotted again
+    _PLOT_CACHE_SIZE = 32
+    # Degree and radian axes of a 360 reading scan, shared by every plot
+    _DEGREES = np.linspace(-180, 179, num=360)
+    _RADIANS = np.deg2rad(np.arange(0, 360))
+
     def __init__(self, plot_config: Optional[PlotConfig] = None):
         """Initialize with optional custom plot configuration"""
         self.config = plot_config or PlotConfig()
-        # Set both style and context
-        sns.set_style(self.config.style)
-        sns.set_context(self.config.context)
+        self._plot_cache: OrderedDict[bytes, bytes] = OrderedDict()
+        # One figure per plot kind, cleared and redrawn on each call instead of being recreated
+        self._figures: Dict[str, Tuple[plt.Figure, plt.Axes]] = {}
+        self._figure_lock = threading.Lock()
         self._setup_plot_defaults()
 
     def _setup_plot_defaults(self) -> None:
-        """Set up default plotting parameters"""
+        """Set up default plotting parameters, skipped when the global state already matches"""
+        global _applied_plot_defaults
+        defaults = (self.config.style, self.config.context, self.config.dpi)
+        if defaults == _applied_plot_defaults:
+            return
+        # Set both style and context
+        sns.set_style(self.config.style)
+        sns.set_context(self.config.context)
         plt.rcParams['figure.dpi'] = self.config.dpi
         plt.rcParams['savefig.dpi'] = self.config.dpi
         plt.rcParams['figure.autolayout'] = True
+        _applied_plot_defaults = defaults
+
+    def _reuse_figure(self, kind: str, figsize: Tuple[int, int], **subplot_kw) -> Tuple[plt.Figure, plt.Axes]:
+        """
+        Get the figure kept for a plot kind with its axes cleared, creating it on first use
+
+        Args:
+            kind: Plot kind the figure is kept for
+            figsize: Figure size in inches
+            **subplot_kw: Keyword arguments for the axes, e.g. projection
+
+        Returns:
+            Tuple of figure and cleared axes
+        """
+        figure = self._figures.get(kind)
+        # plt.close('all') on an error path discards the figure, so recreate it then
+        if figure is None or not plt.fignum_exists(figure[0].number):
+            figure = plt.subplots(figsize=figsize, subplot_kw=subplot_kw or None)
+            self._figures[kind] = figure
+        fig, ax = figure
+        fig.set_size_inches(figsize)
+        # Autolayout tightens the subplot parameters on every draw, start again from the defaults
+        fig.subplots_adjust(**{name: plt.rcParams[f"figure.subplot.{name}"]
+                               for name in ("left", "right", "bottom", "top", "wspace", "hspace")})
+        ax.clear()
+        return fig, ax
 
     @staticmethod
-    @lru_cache(maxsize=32)
-    def _generate_degree_arrays(num_points: int = 360) -> Tuple[np.ndarray, np.ndarray]:
-        """Generate cached degree arrays for plotting"""
-        degrees = np.linspace(-180, 179, num=num_points)
-        radians = np.deg2rad(np.arange(0, num_points))
-        return degrees, radians
+    def _plot_key(kind: str, scan_array: np.ndarray, *extra: object) -> bytes:
+        """Digest of the plot kind, scan values and any extra parameters drawn into the plot"""
+        digest = hashlib.blake2b(repr((kind, extra)).encode(), digest_size=16)
+        digest.update(np.ascontiguousarray(scan_array, dtype=np.int64).tobytes())
+        return digest.digest()
+
+    def _load_cached_plot(self, key: bytes, save_path: str) -> bool:
+        """Write a previously rendered plot to save_path, returns False if it has not been rendered"""
+        data = self._plot_cache.get(key)
+        if data is None:
+            return False
+        self._plot_cache.move_to_end(key)
+        Path(save_path).write_bytes(data)
+        return True
+
+    def _store_cached_plot(self, key: bytes, save_path: str) -> None:
+        """Keep the rendered plot at save_path for reuse, evicting the least recently used one"""
+        self._plot_cache[key] = Path(save_path).read_bytes()
+        if len(self._plot_cache) > self._PLOT_CACHE_SIZE:
+            self._plot_cache.popitem(last=False)
 
     def lidar2image_lineplot(self,
                              scan: List[int],
@@ -46,24 +105,28 @@ class ImageProcess:
         Create and save a line plot of LiDAR data with optimized rendering
         """
         try:
-            degrees, _ = self._generate_degree_arrays()
+            # Use numpy operations for better performance
+            scan_array = np.asarray(scan)
+            key = self._plot_key("line", scan_array, experiment_time, figure_size)
+            if self._load_cached_plot(key, save_path):
+                return
 
-            # Use plt.style.context instead of with statement for style
-            fig, ax = plt.subplots(figsize=figure_size)
+            degrees = self._DEGREES
 
-            # Use numpy operations for better performance
-            scan_array = np.array(scan)
-            sns.lineplot(x=degrees, y=scan_array, ax=ax)
+            with self._figure_lock:
+                # Use plt.style.context instead of with statement for style
+                fig, ax = self._reuse_figure("line", figure_size)
+                sns.lineplot(x=degrees, y=scan_array, ax=ax)
 
-            ax.set_title(f"LiDAR Data Plot (t={experiment_time})")
-            ax.set_xlabel("Degree")
-            ax.set_ylabel("Distance")
-            ax.set_xlim(-180, 180)
-            ax.set_xticks(np.arange(-180, 181, 30))
+                ax.set_title(f"LiDAR Data Plot (t={experiment_time})")
+                ax.set_xlabel("Degree")
+                ax.set_ylabel("Distance")
+                ax.set_xlim(-180, 180)
+                ax.set_xticks(np.arange(-180, 181, 30))
 
-            # Optimize file saving
-            fig.savefig(save_path, bbox_inches='tight', pad_inches=0.1)
-            plt.close(fig)
+                # Optimize file saving
+                fig.savefig(save_path, bbox_inches='tight', pad_inches=0.1)
+            self._store_cached_plot(key, save_path)
 
         except Exception as e:
             plt.close('all')  # Cleanup on error
@@ -75,30 +138,33 @@ class ImageProcess:
         """
         try:
             # Optimize array operations using numpy
-            scan_array = np.array(scan)
+            scan_array = np.asarray(scan)
+            # An unchanged scan (e.g. the robot has not moved) reuses the previous rendering
+            key = self._plot_key("polar", scan_array)
+            if self._load_cached_plot(key, save_path):
+                return
+
             shift_index = 179
             shifted_scan = np.roll(scan_array, -shift_index)
 
-            _, radians = self._generate_degree_arrays()
+            radians = self._RADIANS
             normalized_scan = shifted_scan / np.max(shifted_scan)
 
-            fig, ax = plt.subplots(
-                subplot_kw={"projection": "polar"},
-                figsize=self.config.figsize
-            )
-
-            scatter = ax.scatter(
-                radians,
-                shifted_scan,
-                s=self.config.marker_size,
-                c=normalized_scan,
-                cmap=self.config.cmap,
-                alpha=self.config.alpha
-            )
-
-            self._configure_polar_plot(ax, shifted_scan)
-            fig.savefig(save_path, bbox_inches='tight', pad_inches=0.1)
-            plt.close(fig)
+            with self._figure_lock:
+                fig, ax = self._reuse_figure("polar", self.config.figsize, projection="polar")
+
+                ax.scatter(
+                    radians,
+                    shifted_scan,
+                    s=self.config.marker_size,
+                    c=normalized_scan,
+                    cmap=self.config.cmap,
+                    alpha=self.config.alpha
+                )
+
+                self._configure_polar_plot(ax, shifted_scan)
+                fig.savefig(save_path, bbox_inches='tight', pad_inches=0.1)
+            self._store_cached_plot(key, save_path)
 
         except Exception as e:
             plt.close('all')  # Cleanup on error
@@ -1,15 +1,28 @@
 import math
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from LLMEyesim.eyesim.generator.models import WorldItem
 from loguru import logger
+import numpy as np
+
+def object_coordinates(objects: List[WorldItem]) -> np.ndarray:
+    """
+    Build the (N, 2) array of object x, y coordinates used by calculate_object_positions.
+
+    Callers that match the same objects every tick build it once and pass it in.
+    """
+    coords = np.empty((len(objects), 2), dtype=np.int64)
+    for i, obj in enumerate(objects):
+        coords[i] = obj.x, obj.y
+    return coords
 
 
 def calculate_object_positions(
         robot_pos: Tuple[int, int],  # x, y
         objects: List[WorldItem],
         lidar_data: List[int],
-        distance_threshold: int = 200
+        distance_threshold: int = 200,
+        object_xy: Optional[np.ndarray] = None
 ) -> List[WorldItem]:
     """
     Match objects with lidar readings in 90-270 degree range.
@@ -19,31 +32,35 @@ def calculate_object_positions(
         objects: List of WorldItem objects containing object information
         lidar_data: List of 360 integer distance readings (index 0 = 0 degrees)
         distance_threshold: Maximum distance difference to consider a match
+        object_xy: Coordinates from object_coordinates(objects), built here when not given
 
     Returns:
         List of ObjectPosition objects containing detected objects
     """
 
-    detected_objects = []
+    if not objects:
+        return []
     robot_x, robot_y = robot_pos
 
-    # Only process lidar data from 90 to 270 degrees
-    for angle in range(90, 271):
-        lidar_distance = lidar_data[angle]
+    # Distance to every object is independent of the beam, compute it once per object.
+    # Squared distances stay far below 2**52, so flooring the float sqrt is exact
+    if object_xy is None:
+        object_xy = object_coordinates(objects)
+    elif len(object_xy) != len(objects):
+        raise ValueError(f"object_xy has {len(object_xy)} rows for {len(objects)} objects")
+    dx = object_xy[:, 0] - robot_x
+    dy = object_xy[:, 1] - robot_y
+    distances = np.sqrt(dx * dx + dy * dy).astype(np.int64)
 
-        # Check each object against current lidar reading
-        for obj in objects:
-            # Calculate actual distance to object
-            dx = obj.x - robot_x
-            dy = obj.y - robot_y
-            actual_distance = int((dx * dx + dy * dy) ** 0.5)
+    # Only process lidar data from 90 to 270 degrees, one row per beam and one column per object.
+    # The window is a view of the scan, subtracting it from the int64 distances widens it on the fly
+    beams = np.asarray(lidar_data)[90:271]
+    matches = (np.abs(distances - beams[:, None]) <= distance_threshold) & (distances < 2000)
 
-            # If distance matches lidar reading within threshold
-            if abs(actual_distance - lidar_distance) <= distance_threshold and actual_distance < 2000:
-                detected_objects.append(obj)
-                break  # Move to next angle once we find a matching object
-
-    return detected_objects
+    # Each beam reports the first matching object, like the original per-angle break
+    hit = matches.any(axis=1)
+    first = matches.argmax(axis=1)
+    return [objects[i] for i in first[hit]]
 
 
 def update_object_positions(
@@ -55,17 +72,14 @@ def update_object_positions(
     Now with logging for better debugging.
     """
 
-    # Update existing detections or add new ones
+    # Add new detections, looking ids up in a set instead of rescanning the list
+    known_ids = {obj.item_id for obj in detected_objects}
     for new_obj in new_detected_objects:
-        flag = True
-        for obj in detected_objects:
-            if new_obj.item_id != obj.item_id:
-                continue
-            flag = False
-            break
-        if flag:
-            logger.info(f"Adding new object {new_obj.item_id} {new_obj.item_name} at ({new_obj.x}, {new_obj.y})")
-            detected_objects.append(new_obj)
+        if new_obj.item_id in known_ids:
+            continue
+        logger.info(f"Adding new object {new_obj.item_id} {new_obj.item_name} at ({new_obj.x}, {new_obj.y})")
+        known_ids.add(new_obj.item_id)
+        detected_objects.append(new_obj)
     return detected_objects
 
 
@@ -81,7 +95,24 @@ def calculate_distance(x1: int, y1: int, x2: int, y2: int) -> int:
     Returns:
         int: The distance between the two points
     """
-    return int(math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2))
+    return math.isqrt(int(squared_distance(x1, y1, x2, y2)))
+
+
+def squared_distance(x1: int, y1: int, x2: int, y2: int) -> int:
+    """
+    Calculate the squared distance between two points, for comparisons against a squared threshold.
+
+    Args:
+        x1 (int): x coordinate of the first point
+        y1 (int): y coordinate of the first point
+        x2 (int): x coordinate of the second point
+        y2 (int): y coordinate of the second point
+    Returns:
+        int: The squared distance between the two points
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy
 
 
 def is_movement_safe(
@@ -107,15 +138,11 @@ def is_movement_safe(
     start_angle = 150
     end_angle = 210
 
-    # Check each angle in the range
-    min_distance = 6000
-    min_distance_angle = None
-    # Log distances for each angle being checked
-    for angle in range(start_angle, end_angle + 1):
-        distance = lidar_data[angle]
-        if distance < min_distance:
-            min_distance = distance
-            min_distance_angle = angle
+    # Find the closest reading in the range, argmin keeps the first angle on ties
+    window = np.asarray(lidar_data)[start_angle:end_angle + 1]
+    offset = int(window.argmin())
+    min_distance = int(window[offset])
+    min_distance_angle = start_angle + offset
 
     # Check if the path is clear
     if min_distance <= safety_margin:
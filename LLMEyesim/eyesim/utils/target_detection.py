@@ -1,11 +1,53 @@
+import ctypes
 from loguru import logger
 import numpy as np
-from typing import List, Tuple
-from eye import *
+from typing import List, Optional, Tuple
+from eye import IPCol2HSI, LCDImage, QVGA_X, QVGA_Y
 
 from LLMEyesim.eyesim.generator.models import WorldItem
 from LLMEyesim.eyesim.generator.objects.target import TARGET_LOCATIONS
 
+# Reused LCD frame for the red detection overlay, pushed with a single LCDImage call
+_OVERLAY = np.zeros((QVGA_Y, QVGA_X, 3), dtype=np.uint8)
+_OVERLAY_ROWS = np.arange(QVGA_Y)[:, None]
+_COLUMNS = np.arange(QVGA_X)
+_RED_RGB = (255, 0, 0)
+_RED_HUE_MIN = np.uint8(20)
+
+
+# Hue plane of the last converted frame, so detectors sharing a frame run IPCol2HSI once
+_last_hue: Tuple[object, Optional[np.ndarray]] = (None, None)
+
+
+def clear_hue_cache() -> None:
+    """Forget the cached hue plane, called whenever a new camera frame is read"""
+    global _last_hue
+    _last_hue = (None, None)
+
+
+def _hue_view(img) -> np.ndarray:
+    """Run IPCol2HSI and view its hue plane as a QVGA uint8 array without copying the buffer"""
+    global _last_hue
+    # The cache holds a reference to the frame, so an identity match cannot be a recycled id
+    frame, hue = _last_hue
+    if frame is img:
+        return hue
+
+    frame = img
+    # Byte strings and arrays are only reshaped, ctypes frames from CAMGet go through as they are
+    if isinstance(img, bytes):
+        img = np.frombuffer(img, dtype=np.uint8)
+    if isinstance(img, np.ndarray):
+        img = img.reshape(QVGA_Y, QVGA_X, -1)
+    hue = IPCol2HSI(img)[0]
+    if isinstance(hue, (bytes, bytearray, memoryview)):
+        hue = np.frombuffer(hue, dtype=np.uint8)
+    elif isinstance(hue, ctypes.Array):
+        hue = np.ctypeslib.as_array(hue)
+    hue = np.asarray(hue, dtype=np.uint8).reshape(QVGA_Y, QVGA_X)
+    _last_hue = (frame, hue)
+    return hue
+
 
 def detect_red_target(img, robot_pos: Tuple[int, int, int],
                       target_list: List[WorldItem],
@@ -26,26 +68,18 @@ def detect_red_target(img, robot_pos: Tuple[int, int, int],
     robot_x, robot_y, robot_phi = robot_pos
 
     # 1. Detect red pixels in the image
-    if isinstance(img, np.ndarray):
-        img = img.tobytes()
-
     try:
-        if isinstance(img, bytes):
-            img = np.frombuffer(img, dtype=np.uint8).reshape(QVGA_Y, QVGA_X, -1)
-
-        hsi = IPCol2HSI(img)
-        hue = np.array(hsi[0], dtype=np.float32).reshape(QVGA_Y, QVGA_X)
+        hue = _hue_view(img)
 
-        red_mask = hue > 20
-        red_indices = np.nonzero(red_mask)
-        red_count = len(red_indices[0])
+        red_mask = hue > _RED_HUE_MIN
+        col_counts = np.count_nonzero(red_mask, axis=0)
+        red_count = int(col_counts.sum())
 
         if red_count < threshold:
             return -1
 
-        # 2. Calculate center of red pixels
-        center_y = int(np.mean(red_indices[0]))
-        center_x = int(np.mean(red_indices[1]))
+        # 2. Calculate horizontal center of red pixels from the column histogram
+        center_x = int(np.dot(col_counts, _COLUMNS) / red_count)
 
         # 3. Calculate direction based on red pixel position in the 180° FOV camera
         camera_fov = 180  # degrees
@@ -126,38 +160,31 @@ def detect_red_target(img, robot_pos: Tuple[int, int, int],
     except Exception as e:
         return -1
 
-def red_detector(img) -> Tuple[bool, int, int]:
-    """Optimized red detection with numpy operations and increased cache"""
-    # Convert img to a hashable type for caching
-    if isinstance(img, np.ndarray):
-        img = img.tobytes()  # Convert numpy array to bytes for hashing
+def _lcd_frame(frame: np.ndarray, like):
+    """Wrap frame in the container type returned by CAMGet so LCDImage accepts it"""
+    if isinstance(like, ctypes.Array):
+        return type(like).from_buffer(frame)
+    return frame.tobytes()
 
-    try:
-        # Convert back to array if needed
-        if isinstance(img, bytes):
-            img = np.frombuffer(img, dtype=np.uint8).reshape(QVGA_Y, QVGA_X, -1)
 
-        hsi = IPCol2HSI(img)
-        hue = np.array(hsi[0], dtype=np.float32).reshape(QVGA_Y, QVGA_X)
+def red_detector(img) -> Tuple[bool, int, int]:
+    """Detect red pixels, draw them and their column histogram on the LCD, return the peak column"""
+    try:
+        hue = _hue_view(img)
 
         # Vectorized red detection
-        red_mask = hue > 20
-        red_indices = np.nonzero(red_mask)
+        red_mask = hue > _RED_HUE_MIN
+        # Column histogram straight from the mask, no pixel index arrays
+        red_count = np.count_nonzero(red_mask, axis=0)
 
-        if not red_indices[0].size:
+        if not red_count.any():
             return False, 0, 0
 
-        # Optimized visualization using numpy operations
-        for x, y in zip(red_indices[1], red_indices[0]):
-            LCDPixel(x, y, RED)
-
-        # Efficient column counting using numpy
-        red_count = np.bincount(red_indices[1])
-
-        # Vectorized histogram visualization
-        nonzero_cols = np.nonzero(red_count)[0]
-        for i in nonzero_cols:
-            LCDLine(i, QVGA_Y, i, QVGA_Y - red_count[i], RED)
+        # Paint the red pixels and the column histogram over the camera frame and blit it once
+        _OVERLAY[...] = np.frombuffer(img, dtype=np.uint8).reshape(_OVERLAY.shape)
+        _OVERLAY[red_mask] = _RED_RGB
+        _OVERLAY[_OVERLAY_ROWS >= QVGA_Y - red_count] = _RED_RGB
+        LCDImage(_lcd_frame(_OVERLAY, img))
 
         max_col = np.argmax(red_count)
         return True, int(max_col), int(red_count[max_col])
@@ -1,11 +1,24 @@
+import atexit
+from concurrent.futures import Future, ThreadPoolExecutor
 import csv
+import errno
+import os
 from pathlib import Path
 import shutil
-from typing import Any, Dict
+from typing import IO, Any, Dict, List, Tuple
 
+from PIL import Image
 from loguru import logger
 import pandas as pd
 
+from LLMEyesim.eyesim.utils.config import (
+    CSV_BUFFER_SIZE,
+    CSV_FLUSH_THRESHOLD,
+    LLM_RECORD_BUFFER_SIZE,
+    LLM_ACTION_RECORD_FIELDS,
+    LLM_REASONING_RECORD_FIELDS,
+    STATE_RECORD_FIELDS,
+)
 from LLMEyesim.eyesim.utils.models import TaskPaths
 from LLMEyesim.utils.constants import DATA_DIR
 
@@ -20,7 +33,25 @@ class TaskManager:
         self.llm_reasoning_record_path = self.paths.llm_reasoning_record_path
         self.llm_action_record_path = self.paths.llm_action_record_path
 
-
+        # CSV handles stay open for the whole task and rows are written in batches
+        self._csv_fields: Dict[Path, Tuple[str, ...]] = {
+            self.state_path: STATE_RECORD_FIELDS,
+            self.llm_reasoning_record_path: LLM_REASONING_RECORD_FIELDS,
+            self.llm_action_record_path: LLM_ACTION_RECORD_FIELDS,
+        }
+        # LLM records are written once per inference step, so they get a larger buffer
+        self._csv_buffer_sizes: Dict[Path, int] = {
+            self.llm_reasoning_record_path: LLM_RECORD_BUFFER_SIZE,
+            self.llm_action_record_path: LLM_RECORD_BUFFER_SIZE,
+        }
+        self._csv_files: Dict[Path, IO[str]] = {}
+        self._csv_writers: Dict[Path, csv.DictWriter] = {}
+        self._row_bufs: Dict[Path, List[Dict[str, Any]]] = {}
+        self._flush_threshold = CSV_FLUSH_THRESHOLD
+        # Worker pool for per-step image encoding, see save_image_async
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tm")
+        self._closed = False
+        atexit.register(self.close)
 
     @staticmethod
     def _init_directory(task_name: str) -> TaskPaths:
@@ -45,26 +76,91 @@ class TaskManager:
         """Collect and save robot operation data."""
         logger.info("Data collection started!")
         try:
-            self.save_item_to_csv(item=current_state, file_path=str(self.state_path))
+            self.save_item_to_csv(item=current_state, file_path=self.state_path)
         except Exception as e:
             logger.error(f"Error during data collection: {e}")
             raise
 
-
-
-    @staticmethod
-    def save_item_to_csv(item: Dict[str, Any], file_path: str) -> None:
-        """Save dictionary item to CSV file."""
+    def save_image_async(self, image: Image.Image, file_path: Path | str) -> Future:
+        """Encode and save an image on the worker pool, the returned future resolves once it is on disk."""
+        return self._io_pool.submit(image.save, file_path)
+
+    def save_item_to_csv(self, item: Dict[str, Any], file_path: Path | str) -> None:
+        """Buffer dictionary item and write the batch once the threshold is reached."""
+        path = Path(file_path)
+        # Reject a bad row on the call that adds it, not when its batch is written later
+        fields = self._csv_fields.setdefault(path, tuple(item))
+        if extra := item.keys() - set(fields):
+            raise ValueError(f"Fields {sorted(extra)} are not columns of CSV {path}")
+        rows = self._row_bufs.setdefault(path, [])
+        rows.append(item)
+        if len(rows) >= self._flush_threshold:
+            self._flush_csv(path)
+
+    def _open_csv(self, path: Path, first_row: Dict[str, Any]) -> csv.DictWriter:
+        """Open a long-lived CSV handle, writing the header if the file is new or checking it if not."""
+        fields = self._csv_fields.get(path, tuple(first_row))
+        is_new = not path.exists() or path.stat().st_size == 0
+        if not is_new:
+            with path.open('r', newline='') as existing:
+                header = tuple(next(csv.reader(existing), ()))
+            if header != fields:
+                raise ValueError(f"Existing header {header} in {path} does not match {fields}")
+        file = path.open('a', newline='', buffering=self._csv_buffer_sizes.get(path, CSV_BUFFER_SIZE))
+        writer = csv.DictWriter(file, fieldnames=fields)
+        if is_new:
+            writer.writeheader()
+        self._csv_files[path] = file
+        self._csv_writers[path] = writer
+        return writer
+
+    def _flush_csv(self, path: Path) -> None:
+        """Write all buffered rows for a single CSV file."""
+        rows = self._row_bufs.get(path)
+        if not rows:
+            return
+        # Take the batch out first so a failed write is not retried with rows already written
+        self._row_bufs[path] = []
         try:
-            with Path(file_path).open('a', newline='') as file:
-                writer = csv.DictWriter(file, fieldnames=item.keys())
-                if file.tell() == 0:
-                    writer.writeheader()
-                writer.writerow(item)
-        except IOError as e:
-            logger.error(f"Error writing to CSV {file_path}: {e}")
+            writer = self._csv_writers.get(path) or self._open_csv(path, rows[0])
+            writer.writerows(rows)
+        except (OSError, ValueError) as e:
+            logger.error(f"Error writing to CSV {path}: {e}")
             raise
 
+    def _flush(self) -> None:
+        """Write all buffered rows."""
+        for path in self._row_bufs:
+            self._flush_csv(path)
+
+    def close(self) -> None:
+        """Wait for pending image writes, flush buffered rows and close all CSV handles."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._io_pool.shutdown(wait=True)
+        self._flush()
+        self._finalize_csv()
+
+    def _finalize_csv(self) -> None:
+        """
+        Flush, fsync and close every long-lived CSV handle.
+
+        Rows only reach the disk here or when a buffer fills, so a hard crash can lose
+        up to one buffer worth of the most recent records per file.
+        """
+        for file in self._csv_files.values():
+            if file.closed:
+                continue
+            try:
+                file.flush()
+                os.fsync(file.fileno())
+            finally:
+                file.close()
+        self._csv_files.clear()
+        self._csv_writers.clear()
+
     @staticmethod
     def move_directory_contents(src: Path | str, dst: Path | str) -> None:
         """Move directory contents from source to destination."""
@@ -72,18 +168,29 @@ class TaskManager:
         dst_path = Path(dst)
 
         try:
+            # Fast path: a single rename moves the whole directory
+            try:
+                os.rename(src_path, dst_path)
+                return
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.EEXIST, errno.ENOTEMPTY):
+                    raise
+                cross_device = e.errno == errno.EXDEV
+
             dst_path.mkdir(parents=True, exist_ok=True)
 
             for item in src_path.iterdir():
                 target = dst_path / item.name
-                shutil.move(str(item), str(target))
+                if cross_device:
+                    shutil.move(str(item), str(target))
+                else:
+                    os.rename(item, target)
 
             src_path.rmdir()
         except OSError as e:
             logger.error(f"Error moving directory contents: {e}")
             raise
 
-
     def load_data_from_csv(self) -> pd.DataFrame:
         """Load data from CSV file."""
         try:
@@ -8,12 +8,12 @@ from openai import NotGiven
 from openai.types.chat import completion_create_params
 
 from LLMEyesim.eyesim.actuator.actuator import RobotActuator
-from LLMEyesim.eyesim.actuator.config import GRID_DIRECTION
+from LLMEyesim.eyesim.actuator.config import GRID_DIRECTION, GRID_STEP, SHORTEST_TURN
 from LLMEyesim.eyesim.actuator.models import Position
 from LLMEyesim.eyesim.generator.models import WorldItem
 from LLMEyesim.eyesim.utils.lidar_detection import (
-    calculate_object_positions,
-    update_object_positions, is_movement_safe, calculate_distance,
+    calculate_object_positions, object_coordinates,
+    update_object_positions, is_movement_safe, calculate_distance, squared_distance,
 )
 
 from LLMEyesim.eyesim.utils.target_detection import detect_red_target
@@ -28,7 +28,7 @@ from LLMEyesim.llm.response.models import ActionQueue, WayPointList
 from LLMEyesim.utils.constants import LOG_DIR
 from datetime import datetime
 
-from eye import *
+from eye import VWStraight, VWTurn, VWWait
 
 current_time = datetime.now()
 formatted_time = current_time.strftime("%Y-%m-%d %H:%M:%S")
@@ -38,6 +38,8 @@ logger.add(f"{LOG_DIR}/{formatted_time}.txt", rotation="10 MB", format="{time} |
 class EmbodiedAgent:
     def __init__(self, agent: ExecutiveAgent, actuator: RobotActuator, world_items: List[WorldItem], **kwargs):
         self.world_items = [item for item in world_items if item.item_id != actuator.robot_id]
+        # world items do not move, so their coordinates are converted for lidar matching once
+        self.world_items_xy = object_coordinates(self.world_items)
         self.agent = agent
         self.actuator = actuator
 
@@ -74,7 +76,7 @@ class EmbodiedAgent:
             # update object positions in memory
             new_object_detected = calculate_object_positions(
                 robot_pos=(x, y),
-                objects=self.world_items, lidar_data=scan)
+                objects=self.world_items, lidar_data=scan, object_xy=self.world_items_xy)
             self.detected_objects = update_object_positions(new_object_detected, self.detected_objects)
 
         except Exception as e:
@@ -111,8 +113,8 @@ number of targets remaining: {self.target_remaining}
         for target in self.target_list:
             # consider target as reached if it is detected and within 300mm distance
             for target_id in self.identified_targets:
-                if target_id == target.item_id and calculate_distance(pos.x, pos.y, target.x,
-                                                                      target.y) < 300:
+                if target_id == target.item_id and squared_distance(pos.x, pos.y, target.x,
+                                                                    target.y) < 300 * 300:
                     self.target_remaining -= 1
                     self.reached_targets.append(target.item_id)
         return False
@@ -141,7 +143,7 @@ number of targets remaining: {self.target_remaining}
         self.grid_turn(current_phi, target_degree)
 
         # Calculate distance to target
-        distance = int(math.sqrt(dx * dx + dy * dy))
+        distance = calculate_distance(current_x, current_y, target_x, target_y)
         logger.info(f"{self.actuator.robot_name} {self.actuator.robot_id}: Moving {distance} mm")
 
         # Move straight to target
@@ -167,30 +169,10 @@ number of targets remaining: {self.target_remaining}
         self.grid_turn(phi, target_degree)
         logger.info(f"{self.actuator.robot_name} {self.actuator.robot_id}: Moving {distance} mm")
 
-        # Calculate target position based on direction
-        if direction in ('west', 'southwest', 'south', 'southeast'):
-            distance_x = -distance
-        else:  # east, northeast, north, northwest
-            distance_x = distance
-
-        if direction in ('south', 'southeast', 'southwest'):
-            distance_y = -distance
-        else:  # north, northeast, northwest
-            distance_y = distance
-
-        # Adjust distance for diagonal movements
-        if direction in ('northeast', 'northwest', 'southwest', 'southeast'):
-            distance_x = int(distance_x * 0.707)  # cos(45°)
-            distance_y = int(distance_y * 0.707)  # sin(45°)
-
-        # Calculate final target position
-        target_x = x + (distance_x if direction in ('east', 'west') else  # E, W
-                        0 if direction in ('north', 'south') else  # N, S
-                        distance_x)  # Diagonal
-
-        target_y = y + (distance_y if direction in ('north', 'south') else  # N, S
-                        0 if direction in ('east', 'west') else  # E, W
-                        distance_y)  # Diagonal
+        # Calculate final target position from the per-direction unit step
+        step_x, step_y = GRID_STEP[direction]
+        target_x = x + int(distance * step_x)
+        target_y = y + int(distance * step_y)
 
         return self.grid_straight(target_x, target_y)
 
@@ -198,7 +180,7 @@ number of targets remaining: {self.target_remaining}
             self,
             phi: int,
             target_degree: int,
-            angle_deviation: int = 5
+            angle_deviation: int = 10
     ) -> None:
         """
         Calculate and execute the shortest turn between two angles.
@@ -207,22 +189,20 @@ number of targets remaining: {self.target_remaining}
         Args:
             phi (int): The starting angle in degrees
             target_degree (int): The target angle in degrees
-            angle_deviation (int, optional): Acceptable angle deviation in degrees. Defaults to 5.
+            angle_deviation (int, optional): Acceptable angle deviation in degrees. Defaults to 10.
         Returns:
             None
         """
-        diff = ((target_degree - phi) % 360)
-        degree_to_turn = diff if diff <= 180 else diff - 360
+        degree_to_turn = SHORTEST_TURN[(target_degree - phi) % 360]
         logger.info(f"Turning to target: {degree_to_turn} degrees remaining")
-        while abs(degree_to_turn) > 10:
+        while abs(degree_to_turn) > angle_deviation:
             if degree_to_turn > 0:
                 VWTurn(10, 200)
             else:
                 VWTurn(-10, 200)
             VWWait()
             _, _, _, _, phi = self._process_sensors()
-            diff = ((target_degree - phi) % 360)
-            degree_to_turn = diff if diff <= 180 else diff - 360
+            degree_to_turn = SHORTEST_TURN[(target_degree - phi) % 360]
 
     def grid_straight(self, target_x: int, target_y: int):
         """
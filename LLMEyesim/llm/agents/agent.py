@@ -11,12 +11,15 @@ class ExecutiveAgent:
     def __init__(self, llm_name="gpt-4o", llm_type="cloud"):
         self.llm = LLMManager(llm_name, llm_type)
         self.llm_name = llm_name
+        # enable_defence is fixed for a run, so each system prompt is rendered once
+        self._system_prompts: Dict[bool, str] = {}
 
     def process(self, images: List, human_instruction: str = None, last_command=None,
                 enable_defence: bool = False) -> Dict:
-        action_generation_prompt = PromptV1(enable_defence)
-        system_prompt = action_generation_prompt.create_system_prompt()
-        user_prompt = action_generation_prompt.create_user_prompt(images, human_instruction, last_command)
+        system_prompt = self._system_prompts.get(enable_defence)
+        if system_prompt is None:
+            system_prompt = self._system_prompts[enable_defence] = PromptV1(enable_defence).create_system_prompt()
+        user_prompt = PromptV1.create_user_prompt(images, human_instruction, last_command)
         messages = [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}]
         return self.llm.process(messages=messages)
 
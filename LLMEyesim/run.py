@@ -2,7 +2,7 @@ import argparse
 import subprocess
 import sys
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from loguru import logger
 
@@ -77,21 +77,40 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def launch_eyesim() -> int:
-    """Launch the eyesim simulator."""
+def launch_eyesim() -> Optional[subprocess.Popen]:
+    """Launch the eyesim simulator without waiting for it to exit."""
     try:
-        # Run the eyesim command
-        process = subprocess.Popen("eyesim", shell=True)
-        # Wait for the process to complete
-        process.wait()
-        return process.returncode
-
-    except subprocess.CalledProcessError as e:
-        print(f"Error launching eyesim: {e}", file=sys.stderr)
-        return e.returncode
+        return subprocess.Popen(
+            ["eyesim"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
     except FileNotFoundError:
         print("Error: 'eyesim' command not found. Make sure it's installed and in your PATH", file=sys.stderr)
-        return 1
+        return None
+    except OSError as e:
+        print(f"Error launching eyesim: {e}", file=sys.stderr)
+        return None
+
+
+def wait_for_eyesim(process: subprocess.Popen, startup_time: float = 5.0) -> bool:
+    """Give eyesim time to start.
+
+    There is no readiness check for the simulator, so this is a plain sleep.
+    The eyesim command may be a launcher that hands the simulator off and
+    exits; a zero exit counts as started and the full startup time is waited
+    from there, as before. Only a non-zero exit is reported as a failure.
+    """
+    try:
+        returncode = process.wait(timeout=startup_time)
+    except subprocess.TimeoutExpired:
+        # Still running after the startup time, eyesim runs in this process
+        return True
+    if returncode != 0:
+        return False
+    time.sleep(startup_time)
+    return True
 
 
 def setup_simulation(args: Dict[str, Any]) -> Simulator:
@@ -118,8 +137,9 @@ def setup_simulation(args: Dict[str, Any]) -> Simulator:
         raise
 
     if mode == "1":
-        launch_eyesim()
-        time.sleep(5)  # Wait for eyesim to launch, Adjust it as needed
+        eyesim_process = launch_eyesim()
+        if eyesim_process is None or not wait_for_eyesim(eyesim_process):
+            raise RuntimeError("eyesim failed to start")
         task_name = set_task_name(f"{world}_{model}_{attack}")
         simulator = Simulator(
             task_name=task_name,
@@ -137,7 +157,9 @@ def setup_simulation(args: Dict[str, Any]) -> Simulator:
             llm_name=model,
             llm_type="cloud"
         )
-        launch_eyesim()
+        eyesim_process = launch_eyesim()
+        if eyesim_process is not None:
+            eyesim_process.wait()
 
     return simulator
 
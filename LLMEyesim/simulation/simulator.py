@@ -1,8 +1,8 @@
-from functools import lru_cache
+import json
 import time
 from typing import Dict, List, Tuple
 
-from eye import *
+from eye import KEY4, KEYRead, SIMGetRobot
 from loguru import logger
 
 from LLMEyesim.eyesim.actuator.actuator import Action, RobotActuator
@@ -45,9 +45,8 @@ class Simulator:
             logger.error(f"Failed to initialize simulator components: {str(e)}")
             raise RuntimeError(f"Simulator initialization failed: {str(e)}")
 
-    @lru_cache(maxsize=32)
     def _get_attack_prompt(self, attack_type: str) -> str:
-        """Get cached attack prompt for given attack type"""
+        """Get attack prompt for given attack type"""
         return self.attack_prompts.get(attack_type, "")
 
     def select_prompt_injection(self) -> Tuple[str, List]:
@@ -195,8 +194,13 @@ class Simulator:
     def _collect_and_process_data(self) -> None:
         """Collect and process current state data"""
         paths = self.task_manager.robot_state_path(self.actuator.step)
-        self.image_process.cam2image(self.actuator.img).save(paths["img"])
-        self.image_process.lidar2image(scan=list(self.actuator.scan), save_path=paths["lidar"])
+        # Encode the camera PNG on the worker pool while matplotlib renders the LIDAR plot here,
+        # matplotlib's pyplot state is not thread-safe so it stays on the calling thread
+        cam_future = self.task_manager.save_image_async(
+            self.image_process.cam2image(self.actuator.img), paths["img"]
+        )
+        self.image_process.lidar2image(scan=self.actuator.scan, save_path=paths["lidar"])
+        cam_future.result()
         current_state = self._get_robot_state()
         self.task_manager.data_collection(current_state=current_state)
 
@@ -297,6 +301,7 @@ class Simulator:
 
     def _determine_mission_status(self) -> str:
         """Determine and handle mission status"""
+        self.task_manager.close()
         if self.actuator.step >= self.config.max_steps:
             self.task_manager.move_directory_contents(
                 f"{DATA_DIR}/{self.config.task_name}",
@@ -340,9 +345,9 @@ class Simulator:
             "step": step,
             "task_name": self.task_manager.task_name,
             "model_name": self.agent.llm_name,
-            "perception": perception,
+            "perception": json.dumps(perception),
             "planning": planning,
-            "control": control,
+            "control": json.dumps(control),
             "attack_injected": attack_injected,
             "completion_tokens": completion_tokens,
             "prompt_tokens": prompt_tokens,
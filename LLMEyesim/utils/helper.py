@@ -1,4 +1,7 @@
 import argparse
+from functools import lru_cache
+import os
+import re
 from typing import List, Union
 
 from loguru import logger
@@ -19,34 +22,42 @@ def str2bool(value: Union[str, bool]) -> bool:
 
 def float_in_list(choices: List[float]) -> callable:
     """Create a validator for float values within a set of choices."""
+    allowed = frozenset(choices)
 
     def check_float(value: str) -> float:
         try:
             float_val = float(value)
-            if float_val in choices:
-                return float_val
-            raise argparse.ArgumentTypeError(
-                f'Value must be one of {choices}, got {float_val}'
-            )
         except ValueError:
             raise argparse.ArgumentTypeError(
                 f'Value must be a float, got {value}'
             )
+        if float_val in allowed:
+            return float_val
+        raise argparse.ArgumentTypeError(
+            f'Value must be one of {choices}, got {float_val}'
+        )
 
     return check_float
 
 
+@lru_cache(maxsize=32)
+def _task_pattern(task: str) -> re.Pattern:
+    """Compile the numbered folder name pattern for a task."""
+    return re.compile(rf"^{re.escape(task)}_(\d+)$")
+
+
 def set_task_name(task: str) -> str:
     """Generate numbered task folder name."""
     try:
-        max_num = max(
-            (int(folder.name.split("_")[-1])
-             for folder in DATA_DIR.iterdir()
-             if folder.name.startswith(task) and
-             folder.name.split("_")[-1].isdigit()),
-            default=0
-        )
+        pattern = _task_pattern(task)
+        with os.scandir(DATA_DIR) as entries:
+            max_num = max(
+                (int(match.group(1))
+                 for entry in entries
+                 if (match := pattern.match(entry.name))),
+                default=0
+            )
         return f"{task}_{max_num + 1}"
     except Exception as e:
         logger.error(f"Error generating task name: {e}")
-        return f"{task}_1"
\ No newline at end of file
+        return f"{task}_1"
@@ -0,0 +1,28 @@
+from LLMEyesim.eyesim.actuator.models import Action
+
+
+def test_actions_differing_in_distance_are_not_equal():
+    assert Action('fwd', distance=10) != Action('fwd', distance=20)
+    assert (Action('fwd', distance=10) == Action('fwd', distance=20)) is False
+
+
+def test_actions_differing_in_angle_are_not_equal():
+    assert Action('turn', direction='left', angle=45) != Action('turn', direction='left', angle=90)
+
+
+def test_equal_actions_hash_alike():
+    first = Action('fwd', distance=10)
+    second = Action('fwd', distance=10, safe=False, executed=True, pos_before={'x': 1.0})
+    assert first == second
+    assert hash(first) == hash(second)
+
+
+def test_actions_as_set_keys():
+    actions = {
+        Action('fwd', distance=10),
+        Action('fwd', distance=20),
+        Action('turn', angle=45),
+        Action('turn', angle=90),
+        Action('fwd', distance=10),
+    }
+    assert len(actions) == 4